@@ -5,10 +5,11 @@ from pathlib import Path
 
 import typer
 
-from .embeddings import embedding_service
+from .embeddings import get_embedding_service
 from .evaluation import run_batch_evaluation
 from .graph import run_graph
 from .ingestion import IngestionPipeline
+from .retrieval import reset_hybrid_retriever
 
 app = typer.Typer(help="CLI for the Intelligent Document Q&A system")
 pipeline = IngestionPipeline()
@@ -19,7 +20,11 @@ def ingest(path: Path, uploaded_by: str = "cli") -> None:
     """Ingest a single document from the filesystem."""
 
     chunks = pipeline.ingest(path, uploaded_by)
+    embedding_service = get_embedding_service()
     embedding_service.index_chunks(chunks)
+    embedding_service.flush()
+    # New chunks invalidate cached retrieval results and the BM25 index.
+    reset_hybrid_retriever()
     typer.echo(f"Indexed {len(chunks)} chunks for document {path.name}")
 
 
@@ -31,6 +31,7 @@ class ModelSettings(BaseModel):
     openai_api_base: str | None = Field(default="https://api.openai.com/v1")
     max_input_tokens: int = Field(default=4096)
     max_output_tokens: int = Field(default=1024)
+    eval_parallelism: int = Field(default=8)
 
 
 class RAGSettings(BaseModel):
@@ -38,6 +39,9 @@ class RAGSettings(BaseModel):
     chunk_overlap_tokens: int = Field(default=120)
     top_k_dense: int = Field(default=6)
     top_k_sparse: int = Field(default=4)
+    dense_backend: Literal["faiss", "chroma"] = Field(default="faiss")
+    vector_precision: Literal["float32", "int8"] = Field(default="float32")
+    embedding_batch_size: int = Field(default=64)
     reflection_threshold: float = Field(default=0.65)
     max_reflection_loops: int = Field(default=2)
 
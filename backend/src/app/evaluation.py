@@ -2,50 +2,61 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from time import perf_counter
 
+import numpy as np
 from ragas import evaluate
 from ragas.metrics import answer_relevancy, faithfulness
 
+from .config import settings
 from .graph import run_graph
 from .models import EvaluationResult
 
 SAMPLE_QUERIES_PATH = Path("sample_data/sample_queries.json")
 
 
+def _evaluate_item(item: dict) -> tuple[float, EvaluationResult]:
+    """Run the graph + ragas scoring for one query; returns (latency_ms, result)."""
+
+    query_id = item["id"]
+    question = item["question"]
+    expected = item.get("expected_answer")
+    start = perf_counter()
+    answer = run_graph(question)
+    latency = (perf_counter() - start) * 1000
+    ragas_scores = evaluate(
+        model_outputs=[{"question": question, "answer": answer.answer, "contexts": answer.evidence}],
+        metrics=[answer_relevancy, faithfulness],
+    )
+    metrics_df = ragas_scores.to_pandas()
+    result = EvaluationResult(
+        query_id=query_id,
+        exact_match=1.0 if expected and expected.lower() in answer.answer.lower() else 0.0,
+        semantic_similarity=float(metrics_df["answer_relevancy"].iloc[0]),
+        grounding_score=float(metrics_df["faithfulness"].iloc[0]),
+        latency_stats={"latency_ms": latency},
+        token_usage={"prompt": 0, "completion": 0},
+    )
+    return latency, result
+
+
 def run_batch_evaluation() -> list[EvaluationResult]:
     with open(SAMPLE_QUERIES_PATH, encoding="utf-8") as handle:
         dataset = json.load(handle)
-    results: list[EvaluationResult] = []
-    latencies: list[float] = []
-    for item in dataset:
-        query_id = item["id"]
-        question = item["question"]
-        expected = item.get("expected_answer")
-        start = perf_counter()
-        answer = run_graph(question)
-        latency = (perf_counter() - start) * 1000
-        latencies.append(latency)
-        ragas_scores = evaluate(
-            model_outputs=[{"question": question, "answer": answer.answer, "contexts": answer.evidence}],
-            metrics=[answer_relevancy, faithfulness],
-        )
-        metrics_df = ragas_scores.to_pandas()
-        result = EvaluationResult(
-            query_id=query_id,
-            exact_match=1.0 if expected and expected.lower() in answer.answer.lower() else 0.0,
-            semantic_similarity=float(metrics_df["answer_relevancy"].iloc[0]),
-            grounding_score=float(metrics_df["faithfulness"].iloc[0]),
-            latency_stats={"latency_ms": latency},
-            token_usage={"prompt": 0, "completion": 0},
-        )
-        results.append(result)
-    summary = {
-        "p50": sorted(latencies)[len(latencies) // 2],
-        "p95": sorted(latencies)[int(len(latencies) * 0.95) - 1],
-    }
+    # Each item blocks on LLM round-trips, so thread-level parallelism applies.
+    max_workers = max(1, settings.model.eval_parallelism)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(_evaluate_item, dataset))
+    latencies = [latency for latency, _ in outcomes]
+    results = [result for _, result in outcomes]
+    if latencies:
+        p50, p95 = np.percentile(latencies, [50, 95], method="nearest")
+        summary = {"p50": float(p50), "p95": float(p95)}
+    else:
+        summary = {}
     output_path = Path("data/evaluations/latest.json")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
@@ -1,17 +1,25 @@
 """LangGraph definition for self-reflective RAG."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-import uuid
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, TypedDict
 
-from langgraph.checkpoint.memory import MemorySaver
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from langgraph.graph import END, START, StateGraph
 
 from .config import settings
-from .llm import llm_service
-from .models import Citation, QAResponse, RetrievedChunk
-from .retrieval import hybrid_retriever
+from .llm import get_llm_service
+from .models import Chunk, Citation, QAResponse, RetrievedChunk
+from .retrieval import get_hybrid_retriever
 
 
 class GraphState(TypedDict, total=False):
@@ -61,15 +69,37 @@ def _normalize_confidence(value: Any) -> float:
 _SOURCE_NAME_CACHE: dict[str, str] = {}
 
 
+@lru_cache(maxsize=1)
+def _warm_source_name_cache() -> None:
+    """Bulk-load all source names with one directory scan, once per process."""
+
+    metadata_dir = settings.paths.data_dir / "metadata"
+    if not metadata_dir.exists():
+        return
+    for meta_path in metadata_dir.glob("*.json"):
+        try:
+            if orjson is not None:
+                data = orjson.loads(meta_path.read_bytes())
+            else:
+                data = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        source_name = data.get("source_name")
+        if source_name:
+            _SOURCE_NAME_CACHE.setdefault(meta_path.stem, source_name)
+
+
 def _resolve_source_name(document_id: str | None, default: str | None = None) -> str | None:
     """Resolve the human-friendly file name for a document ID."""
     if default:
         return default
     if not document_id:
         return None
+    _warm_source_name_cache()
     cached = _SOURCE_NAME_CACHE.get(document_id)
     if cached:
         return cached
+    # Fallback for documents ingested after the warmup scan.
     metadata_dir = settings.paths.data_dir / "metadata"
     meta_path = metadata_dir / f"{document_id}.json"
     if not meta_path.exists():
@@ -84,10 +114,9 @@ def _resolve_source_name(document_id: str | None, default: str | None = None) ->
     return source_name
 
 
-def _normalize_citations(raw_citations: Any, retrieved: list[RetrievedChunk]) -> list[Citation]:
+def _normalize_citations(raw_citations: Any, chunk_by_id: dict[str, Chunk]) -> list[Citation]:
     citations: list[Citation] = []
     items = raw_citations if isinstance(raw_citations, list) else ([raw_citations] if raw_citations else [])
-    chunk_by_id = {item.chunk.chunk_id: item.chunk for item in retrieved}
     for entry in items:
         document_id: str | None = None
         source_name: str | None = None
@@ -104,7 +133,7 @@ def _normalize_citations(raw_citations: Any, retrieved: list[RetrievedChunk]) ->
                 or entry.get("document_name")
                 or (chunk.metadata.get("source_name") if chunk else None)
             )
-            page_raw = entry.get("page_number") or entry.get("page")
+            page_raw = entry.get("page_number", entry.get("page"))
             try:
                 page_number = int(page_raw) if page_raw is not None else None
             except (TypeError, ValueError):
@@ -136,8 +165,8 @@ def _normalize_citations(raw_citations: Any, retrieved: list[RetrievedChunk]) ->
                 )
             )
 
-    if not citations and retrieved:
-        chunk = retrieved[0].chunk
+    if not citations and chunk_by_id:
+        chunk = next(iter(chunk_by_id.values()))
         citations.append(
             Citation(
                 document_id=chunk.document_id,
@@ -149,17 +178,21 @@ def _normalize_citations(raw_citations: Any, retrieved: list[RetrievedChunk]) ->
     return citations
 
 
-def retrieve_node(state: GraphState) -> GraphState:
-    retrieved = hybrid_retriever.retrieve(state["question"])
+async def retrieve_node(state: GraphState) -> GraphState:
+    # Async node: aretrieve overlaps the dense and sparse stages, so the
+    # retrieval step costs max(dense, sparse) instead of their sum.
+    retrieved = await get_hybrid_retriever().aretrieve(state["question"])
     return {**state, "retrieved": retrieved}
 
 
 def draft_node(state: GraphState) -> GraphState:
-    context = format_context(state["retrieved"])
-    raw = llm_service.draft(state["question"], context)
+    retrieved = state["retrieved"]
+    context = format_context(retrieved)
+    chunk_by_id = {item.chunk.chunk_id: item.chunk for item in retrieved}
+    raw = get_llm_service().draft(state["question"], context)
     response = QAResponse(
         answer=_normalize_answer(raw.get("answer") or raw.get("text")),
-        citations=_normalize_citations(raw.get("citations"), state["retrieved"]),
+        citations=_normalize_citations(raw.get("citations"), chunk_by_id),
         evidence=_normalize_evidence(raw.get("evidence", [])),
         confidence=_normalize_confidence(raw.get("confidence", 0.5)),
         not_found_reason=raw.get("not_found_reason"),
@@ -170,7 +203,7 @@ def draft_node(state: GraphState) -> GraphState:
 
 def reflect_node(state: GraphState) -> GraphState:
     context = format_context(state["retrieved"])
-    report = llm_service.reflect(state["question"], state["answer"].answer, context)
+    report = get_llm_service().reflect(state["question"], state["answer"].answer, context)
     reflections = state.get("reflections", []) + [report]
     return {**state, "reflections": reflections}
 
@@ -195,27 +228,55 @@ def build_graph() -> StateGraph:
     graph.add_edge("retrieve", "draft")
     graph.add_edge("draft", "reflect")
     graph.add_conditional_edges("reflect", needs_reflection)
-    graph.add_edge("draft", END)
     return graph
 
 
-def run_graph(question: str) -> QAResponse:
+# Size-bounded LRU over fixed-width digest keys; guarded for concurrent
+# FastAPI workers.
+_CACHE_MAX_ENTRIES = 1024
+_CACHE: OrderedDict[bytes, QAResponse] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(question: str) -> bytes:
+    return hashlib.blake2b(question.encode(), digest_size=16).digest()
+
+
+@lru_cache(maxsize=1)
+def _get_compiled_graph():
+    """Build and compile the graph once.
+
+    No checkpointer: the pipeline never interrupts or resumes, and a
+    process-lifetime saver would retain every invocation's full state.
+    """
+
+    return build_graph().compile()
+
+
+async def arun_graph(question: str) -> QAResponse:
     use_cache = getattr(getattr(settings, "cache", None), "enabled", False)
-    cache_key = f"qa:{question}"
+    cache_key = _cache_key(question)
 
     if use_cache:
-        cached = _CACHE.get(cache_key)
-        if cached is not None:
-            return cached
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_key)
+            if cached is not None:
+                _CACHE.move_to_end(cache_key)
+                return cached
 
-    graph = build_graph()
-    compiled = graph.compile(checkpointer=MemorySaver())
+    compiled = _get_compiled_graph()
     state = {"question": question}
-    config = {"configurable": {"thread_id": str(uuid.uuid4())}}
-    final_state = compiled.invoke(state, config=config)
+    final_state = await compiled.ainvoke(state)
     if use_cache:
-        _CACHE[cache_key] = final_state["answer"]
+        with _CACHE_LOCK:
+            _CACHE[cache_key] = final_state["answer"]
+            _CACHE.move_to_end(cache_key)
+            while len(_CACHE) > _CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
     return final_state["answer"]
 
 
-_CACHE: dict[str, QAResponse] = {}
+def run_graph(question: str) -> QAResponse:
+    """Synchronous wrapper for CLI and worker-thread callers."""
+
+    return asyncio.run(arun_graph(question))
@@ -5,12 +5,20 @@ import hashlib
 import json
 import mimetypes
 from collections.abc import Iterable
+from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import langchain
+import tiktoken
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 from langchain_community.document_loaders import (
-    PyPDFLoader,
+    PyMuPDFLoader,
     TextLoader,
     UnstructuredPowerPointLoader,
     UnstructuredWordDocumentLoader,
@@ -25,7 +33,22 @@ from .models import Chunk, DocumentMetadata
 
 langchain.verbose = False
 
-NON_ASCII_THRESHOLD = 128
+LANGUAGE_SAMPLE_CHARS = 16384
+TOKEN_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def _token_encoder() -> tiktoken.Encoding | None:
+    """Shared cl100k_base encoder, built once per process.
+
+    Returns None when the vocabulary can't be fetched (tiktoken downloads
+    the BPE file on first use), so offline environments keep working.
+    """
+
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception:  # noqa: BLE001 - network/cache failure
+        return None
 
 
 class IngestionPipeline:
@@ -42,11 +65,21 @@ class IngestionPipeline:
     }
 
     def __init__(self) -> None:
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.rag.chunk_size_tokens,
-            chunk_overlap=settings.rag.chunk_overlap_tokens,
-            separators=["\n\n", "\n", ". ", " "],
-        )
+        if _token_encoder() is not None:
+            # Token-accurate splitting: chunk_size_tokens now really means tokens.
+            self.splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name=TOKEN_ENCODING,
+                chunk_size=settings.rag.chunk_size_tokens,
+                chunk_overlap=settings.rag.chunk_overlap_tokens,
+                separators=["\n\n", "\n", ". ", " "],
+            )
+        else:
+            # Offline fallback: character-length splitting, as before.
+            self.splitter = RecursiveCharacterTextSplitter(
+                chunk_size=settings.rag.chunk_size_tokens,
+                chunk_overlap=settings.rag.chunk_overlap_tokens,
+                separators=["\n\n", "\n", ". ", " "],
+            )
 
     def load(self, path: Path) -> list[Document]:
         """Load the document with an appropriate LangChain loader."""
@@ -54,7 +87,7 @@ class IngestionPipeline:
         mime_type, _ = mimetypes.guess_type(path)
         loader: object | None = None
         if mime_type == "application/pdf":
-            loader = PyPDFLoader(str(path))
+            loader = PyMuPDFLoader(str(path))
         elif mime_type in {
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             "application/msword",
@@ -80,10 +113,13 @@ class IngestionPipeline:
     def chunk(self, docs: Iterable[Document], metadata: DocumentMetadata) -> list[Chunk]:
         """Split documents into overlapping chunks with metadata."""
 
-        lc_docs = [Document(page_content=doc.page_content, metadata={**doc.metadata}) for doc in docs]
+        # split_documents copies metadata per child, so no defensive rebuild needed.
+        lc_docs = list(docs)
         split_docs = self.splitter.split_documents(lc_docs)
+        encoder = _token_encoder()
         chunks: list[Chunk] = []
         for idx, split_doc in enumerate(split_docs):
+            split_doc.metadata["source_name"] = metadata.source_name
             chunks.append(
                 Chunk(
                     chunk_id=f"{metadata.document_id}:{idx}",
@@ -92,17 +128,28 @@ class IngestionPipeline:
                     section=split_doc.metadata.get("section") or split_doc.metadata.get("heading"),
                     page_number=split_doc.metadata.get("page") or split_doc.metadata.get("page_number"),
                     chunk_index=idx,
-                    token_count=len(split_doc.page_content.split()),
-                    metadata={**split_doc.metadata, "source_name": metadata.source_name},
+                    token_count=(
+                        len(encoder.encode(split_doc.page_content))
+                        if encoder is not None
+                        else len(split_doc.page_content.split())
+                    ),
+                    metadata=split_doc.metadata,
                 )
             )
         return chunks
 
-    def ingest(self, file_path: Path, uploaded_by: str = "anonymous") -> list[Chunk]:
-        """Full ingestion pipeline for a single file."""
+    def ingest(
+        self, file_path: Path, uploaded_by: str = "anonymous", checksum: str | None = None
+    ) -> list[Chunk]:
+        """Full ingestion pipeline for a single file.
+
+        Callers that already hashed the payload (e.g. while streaming an
+        upload to disk) pass `checksum` to avoid re-reading the file.
+        """
 
         docs = self.load(file_path)
-        checksum = self._checksum(file_path)
+        if checksum is None:
+            checksum = self._checksum(file_path)
         metadata = DocumentMetadata(
             document_id=checksum[:12],
             source_name=file_path.name,
@@ -119,18 +166,19 @@ class IngestionPipeline:
 
     @staticmethod
     def _checksum(file_path: Path) -> str:
-        digest = hashlib.sha256()
         with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python >= 3.11: zero-copy C path
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            digest = hashlib.sha256()
             for block in iter(lambda: f.read(65536), b""):
                 digest.update(block)
-        return digest.hexdigest()
+            return digest.hexdigest()
 
     @staticmethod
     def _detect_language(docs: Iterable[Document]) -> str:
-        sample_text = " ".join(doc.page_content for doc in docs[:3]) if isinstance(docs, list) else ""
-        if any(ord(ch) > NON_ASCII_THRESHOLD for ch in sample_text):
-            return "multilingual"
-        return "en"
+        sample = " ".join(doc.page_content for doc in list(docs)[:3])[:LANGUAGE_SAMPLE_CHARS]
+        # str.isascii() is a C-level scan that bails on the first non-ASCII char.
+        return "en" if sample.isascii() else "multilingual"
 
     @staticmethod
     def _persist_metadata(metadata: DocumentMetadata, chunks: list[Chunk]) -> None:
@@ -138,29 +186,26 @@ class IngestionPipeline:
         metadata_dir.mkdir(parents=True, exist_ok=True)
         meta_path = metadata_dir / f"{metadata.document_id}.json"
         chunk_path = metadata_dir / f"{metadata.document_id}_chunks.jsonl"
-        meta_path.write_text(
-            "{\n"
-            f'  "document_id": "{metadata.document_id}",\n'
-            f'  "source_name": "{metadata.source_name}",\n'
-            f'  "mime_type": "{metadata.mime_type}",\n'
-            f'  "language": "{metadata.language}",\n'
-            f'  "checksum": "{metadata.checksum}",\n'
-            f'  "uploaded_by": "{metadata.uploaded_by}",\n'
-            f'  "page_count": {metadata.page_count},\n'
-            f'  "created_at": "{metadata.created_at.isoformat()}"\n'
-            "}\n"
-        )
-
-        with open(chunk_path, "w", encoding="utf-8") as handle:
-            for chunk in chunks:
-                payload = {
-                    "chunk_id": chunk.chunk_id,
-                    "document_id": chunk.document_id,
-                    "text": chunk.text,
-                    "section": chunk.section,
-                    "page_number": chunk.page_number,
-                    "chunk_index": chunk.chunk_index,
-                    "token_count": chunk.token_count,
-                    "metadata": chunk.metadata,
-                }
-                handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        meta_path.write_text(json.dumps(asdict(metadata), default=str, indent=2), encoding="utf-8")
+
+        payloads = [
+            {
+                "chunk_id": chunk.chunk_id,
+                "document_id": chunk.document_id,
+                "text": chunk.text,
+                "section": chunk.section,
+                "page_number": chunk.page_number,
+                "chunk_index": chunk.chunk_index,
+                "token_count": chunk.token_count,
+                "metadata": chunk.metadata,
+            }
+            for chunk in chunks
+        ]
+        # One buffered write instead of a syscall per chunk.
+        if orjson is not None:
+            chunk_path.write_bytes(b"\n".join(orjson.dumps(payload) for payload in payloads) + b"\n")
+        else:
+            chunk_path.write_text(
+                "\n".join(json.dumps(payload, ensure_ascii=False) for payload in payloads) + "\n",
+                encoding="utf-8",
+            )
@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
-from langchain_core.messages import BaseMessage
-from langchain_core.prompts import ChatPromptTemplate
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_ollama import ChatOllama
 from langchain_openai import ChatOpenAI
 
@@ -40,40 +45,32 @@ class LLMService:
                 max_retries=2,
                 num_ctx=settings.model.max_input_tokens,
             )
-        self.draft_prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a retrieval-grounded assistant. Use only provided context. Cite sources by doc id and page. If evidence missing, say you don't know.",
-                ),
-                (
-                    "human",
-                    "Question: {question}\n\nContext:\n{context}\n\nRespond with JSON containing answer, citations, evidence, confidence, and not_found_reason.",
-                ),
-            ]
+        # System messages never change, so build them once instead of walking a
+        # ChatPromptTemplate on every call.
+        self._draft_system = SystemMessage(
+            content="You are a retrieval-grounded assistant. Use only provided context. Cite sources by doc id and page. If evidence missing, say you don't know.",
         )
-        self.reflection_prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You critique QA outputs for groundedness. Flag if any claim lacks citation or context coverage is low.",
-                ),
-                (
-                    "human",
-                    "Question: {question}\nAnswer: {answer}\nContext:\n{context}\nProvide score between 0 and 1 and reasoning.",
-                ),
-            ]
+        self._reflection_system = SystemMessage(
+            content="You critique QA outputs for groundedness. Flag if any claim lacks citation or context coverage is low.",
         )
 
     def draft(self, question: str, context: str) -> dict[str, Any]:
-        response = self.llm.invoke(self.draft_prompt.format_messages(question=question, context=context))
-        return self._safe_json(response)
+        messages = [
+            self._draft_system,
+            HumanMessage(
+                content=f"Question: {question}\n\nContext:\n{context}\n\nRespond with JSON containing answer, citations, evidence, confidence, and not_found_reason.",
+            ),
+        ]
+        return self._safe_json(self.llm.invoke(messages))
 
     def reflect(self, question: str, answer: str, context: str) -> dict[str, Any]:
-        response = self.llm.invoke(
-            self.reflection_prompt.format_messages(question=question, answer=answer, context=context)
-        )
-        return self._safe_json(response)
+        messages = [
+            self._reflection_system,
+            HumanMessage(
+                content=f"Question: {question}\nAnswer: {answer}\nContext:\n{context}\nProvide score between 0 and 1 and reasoning.",
+            ),
+        ]
+        return self._safe_json(self.llm.invoke(messages))
 
     @staticmethod
     def _safe_json(message: BaseMessage) -> dict[str, Any]:
@@ -86,17 +83,33 @@ class LLMService:
 
         cleaned = content.strip()
         if cleaned.startswith("```"):
-            lines = cleaned.splitlines()
-            if lines and lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].startswith("```"):
-                lines = lines[:-1]
-            cleaned = "\n".join(lines).strip()
+            # Strip the code fence with index arithmetic instead of splitlines().
+            newline = cleaned.find("\n")
+            end = cleaned.rfind("```")
+            if newline != -1 and end > newline:
+                cleaned = cleaned[newline + 1 : end].strip()
 
+        if orjson is not None:
+            try:
+                return orjson.loads(cleaned)
+            except orjson.JSONDecodeError:
+                return {"raw": content}
         try:
             return json.loads(cleaned)
         except json.JSONDecodeError:
             return {"raw": content}
 
 
-llm_service = LLMService()
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """Construct the shared LLMService on first use."""
+
+    return LLMService()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from .llm import llm_service` keeps working, but importing this
+    # module no longer builds the chat client.
+    if name == "llm_service":
+        return get_llm_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,102 +1,136 @@
 """Hybrid retrieval utilities with deduplication and reranking."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import json
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 
-from langchain_community.document_transformers import LongContextReorder
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import bm25s
+except ImportError:  # pragma: no cover - optional speedup
+    bm25s = None
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional speedup
+    faiss = None
+
+import numpy as np
 from langchain_community.retrievers import BM25Retriever
 from langchain_core.documents import Document
 
 from .config import settings
-from .embeddings import embedding_service
+from .embeddings import get_embedding_service
 from .models import Chunk, RetrievedChunk
+from .retrieval_kernels import merge_topk
 
+_CHUNKS_CACHE_NAME = "_chunks_cache.pkl"
+_BM25_CACHE_NAME = "_bm25.pkl"
+_BM25S_INDEX_DIRNAME = "_bm25s_index"
+_BM25S_FINGERPRINT_NAME = "corpus.fingerprint"
+_QUERY_CACHE_SIZE = 1024
 
-def _load_all_chunks() -> list[Chunk]:
-    metadata_dir = settings.paths.data_dir / "metadata"
-    if not metadata_dir.exists():
-        return []
-    chunks: list[Chunk] = []
-    for chunk_file in metadata_dir.glob("*_chunks.jsonl"):
-        with open(chunk_file, encoding="utf-8") as handle:
-            for line in handle:
-                if not line.strip():
-                    continue
-                payload = json.loads(line)
-                chunk = Chunk(
-                    chunk_id=payload["chunk_id"],
-                    document_id=payload["document_id"],
-                    text=payload["text"],
-                    section=payload.get("section"),
-                    page_number=payload.get("page_number"),
-                    chunk_index=payload.get("chunk_index", 0),
-                    token_count=payload.get("token_count", len(payload["text"].split())),
-                    metadata=payload.get("metadata", {}),
-                )
-                chunks.append(chunk)
-    return chunks
 
+class ChunkStore:
+    """Structure-of-arrays view of the chunk corpus.
 
-class HybridRetriever:
-    """Combines dense (Chroma) and sparse (BM25) retrievers with reranking."""
+    Retrieval stages pass integer row indices around and only materialize
+    Chunk/Document objects for the final top-k results, instead of
+    constructing a dataclass plus metadata dict per candidate per stage.
+    """
+
+    __slots__ = (
+        "chunk_ids",
+        "document_ids",
+        "text_ids",
+        "unique_texts",
+        "sections",
+        "page_numbers",
+        "chunk_indexes",
+        "token_counts",
+        "metadatas",
+        "row_by_chunk_id",
+        "_text_id_by_text",
+    )
 
     def __init__(self) -> None:
-        self.dense = embedding_service.store.as_retriever(search_kwargs={"k": settings.rag.top_k_dense})
-        docs = [chunk_to_document(chunk) for chunk in _load_all_chunks()]
-        if docs:
-            self.sparse = BM25Retriever.from_documents(docs)
-            self.sparse.k = settings.rag.top_k_sparse
-        else:
-            self.sparse = None
-        self.reorder = LongContextReorder()
+        self.chunk_ids: list[str] = []
+        self.document_ids: list[str] = []
+        # Dictionary compression: boilerplate chunks (headers, disclaimers,
+        # templated sections) are stored once and referenced by id.
+        self.text_ids: list[int] = []
+        self.unique_texts: list[str] = []
+        self.sections: list[str | None] = []
+        self.page_numbers: list[int | None] = []
+        self.chunk_indexes: list[int] = []
+        self.token_counts: list[int] = []
+        self.metadatas: list[dict[str, Any]] = []
+        self.row_by_chunk_id: dict[str, int] = {}
+        self._text_id_by_text: dict[str, int] = {}
 
-    def retrieve(self, query: str) -> list[RetrievedChunk]:
-        dense_docs = self.dense.invoke(query) if self.dense else []
-        sparse_docs = self.sparse.invoke(query) if self.sparse else []
-        weighted_docs = [
-            (doc, 0.7 * (1 - idx * 0.05)) for idx, doc in enumerate(dense_docs)
-        ] + [
-            (doc, 0.3 * (1 - idx * 0.05)) for idx, doc in enumerate(sparse_docs)
-        ]
-        merged: dict[str, RetrievedChunk] = {}
-        for doc, score in weighted_docs:
-            chunk_id = (
-                doc.metadata.get("chunk_id")
-                or doc.metadata.get("id")
-                or doc.metadata.get("source")
-                or str(len(merged))
-            )
-            if chunk_id in merged and merged[chunk_id].score >= score:
-                continue
-            chunk = Chunk(
-                chunk_id=chunk_id,
-                document_id=doc.metadata.get("document_id", "unknown"),
-                text=doc.page_content,
-                section=doc.metadata.get("section"),
-                page_number=doc.metadata.get("page_number"),
-                chunk_index=int(doc.metadata.get("chunk_index", 0)),
-                token_count=len(doc.page_content.split()),
-                metadata=doc.metadata,
-            )
-            merged[chunk_id] = RetrievedChunk(chunk=chunk, score=score)
-        ordered = sorted(merged.values(), key=lambda item: item.score, reverse=True)
-        docs = [chunk_to_document(item.chunk) for item in ordered]
-        reordered = self.reorder.transform_documents(docs)
-        final_chunks: list[RetrievedChunk] = []
-        for rank, doc in enumerate(reordered):
-            chunk_id = doc.metadata.get("chunk_id") or doc.metadata.get("id") or f"combined-{rank}"
-            chunk = Chunk(
-                chunk_id=chunk_id,
-                document_id=doc.metadata.get("document_id", "unknown"),
-                text=doc.page_content,
-                section=doc.metadata.get("section"),
-                page_number=doc.metadata.get("page_number"),
-                chunk_index=int(doc.metadata.get("chunk_index", rank)),
-                token_count=len(doc.page_content.split()),
-                metadata=doc.metadata,
-            )
-            final_chunks.append(RetrievedChunk(chunk=chunk, score=1 - (rank * 0.05)))
-        return final_chunks
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def append(self, payload: dict[str, Any]) -> None:
+        text = payload["text"]
+        chunk_id = payload["chunk_id"]
+        token_count = payload.get("token_count")
+        section = payload.get("section")
+        text_id = self._text_id_by_text.get(text)
+        if text_id is None:
+            text_id = len(self.unique_texts)
+            self._text_id_by_text[text] = text_id
+            self.unique_texts.append(text)
+        self.row_by_chunk_id[chunk_id] = len(self.chunk_ids)
+        self.chunk_ids.append(chunk_id)
+        self.document_ids.append(payload["document_id"])
+        self.text_ids.append(text_id)
+        # Section names repeat heavily across a document; intern them.
+        self.sections.append(sys.intern(section) if isinstance(section, str) else section)
+        self.page_numbers.append(payload.get("page_number"))
+        self.chunk_indexes.append(payload.get("chunk_index", 0))
+        self.token_counts.append(token_count if token_count is not None else len(text.split()))
+        self.metadatas.append(payload.get("metadata", {}))
+
+    def text(self, row: int) -> str:
+        return self.unique_texts[self.text_ids[row]]
+
+    def materialize(self, row: int) -> Chunk:
+        return Chunk(
+            chunk_id=self.chunk_ids[row],
+            document_id=self.document_ids[row],
+            text=self.text(row),
+            section=self.sections[row],
+            page_number=self.page_numbers[row],
+            chunk_index=self.chunk_indexes[row],
+            token_count=self.token_counts[row],
+            metadata=self.metadatas[row],
+        )
+
+    def document(self, row: int) -> Document:
+        return Document(
+            page_content=self.text(row),
+            metadata={
+                "chunk_id": self.chunk_ids[row],
+                "document_id": self.document_ids[row],
+                "section": self.sections[row],
+                "page_number": self.page_numbers[row],
+                "chunk_index": self.chunk_indexes[row],
+                "token_count": self.token_counts[row],
+                **self.metadatas[row],
+            },
+        )
 
 
 def chunk_to_document(chunk: Chunk) -> Document:
@@ -108,9 +142,410 @@ def chunk_to_document(chunk: Chunk) -> Document:
             "section": chunk.section,
             "page_number": chunk.page_number,
             "chunk_index": chunk.chunk_index,
+            "token_count": chunk.token_count,
             **chunk.metadata,
         },
     )
 
 
-hybrid_retriever = HybridRetriever()
+def _chunk_files() -> list[Path]:
+    metadata_dir = settings.paths.data_dir / "metadata"
+    if not metadata_dir.exists():
+        return []
+    return sorted(metadata_dir.glob("*_chunks.jsonl"))
+
+
+def _corpus_fingerprint(chunk_files: list[Path]) -> str:
+    """Cheap mtime+size fingerprint of the jsonl corpus for cache validation."""
+
+    stats = [(path.name, path.stat().st_mtime_ns, path.stat().st_size) for path in chunk_files]
+    return hashlib.sha256(repr(stats).encode()).hexdigest()
+
+
+def _load_chunk_store(chunk_files: list[Path]) -> ChunkStore:
+    store = ChunkStore()
+    append = store.append
+    loads = json.loads if orjson is None else orjson.loads
+    for chunk_file in chunk_files:
+        # One bulk read per file; splitlines avoids Python-level line buffering.
+        for line in chunk_file.read_bytes().splitlines():
+            if line:
+                append(loads(line))
+    return store
+
+
+class BM25SRetriever:
+    """Sparse retriever backed by bm25s, with numba-JIT scoring when available.
+
+    Indexed in ChunkStore row order, so scored hits come back as row indices
+    directly and no Document objects are built on the hot path.
+    """
+
+    def __init__(self, store: ChunkStore, k: int) -> None:
+        self.k = k
+        self.n_docs = len(store)
+        # Tokenize each unique text once and fan the token lists back out to
+        # rows, so duplicated boilerplate is only scanned a single time.
+        unique_tokens = bm25s.tokenize(store.unique_texts, show_progress=False)
+        tokens = bm25s.tokenization.Tokenized(
+            ids=[unique_tokens.ids[text_id] for text_id in store.text_ids],
+            vocab=unique_tokens.vocab,
+        )
+        self.bm25 = bm25s.BM25(method="lucene")
+        self.bm25.index(tokens, show_progress=False)
+        self.backend_selection = "auto"
+        self._activate_numba()
+
+    def _activate_numba(self) -> None:
+        if importlib.util.find_spec("numba") is None:
+            return
+        try:
+            self.bm25.activate_numba_scorer()
+            self.backend_selection = "numba"
+        except Exception:  # noqa: BLE001
+            pass
+
+    def rows(self, query: str) -> list[int]:
+        return self.rows_batch([query])[0]
+
+    def rows_batch(self, queries: list[str]) -> list[list[int]]:
+        k = min(self.k, self.n_docs)
+        if k <= 0 or not queries:
+            return [[] for _ in queries]
+        query_tokens = bm25s.tokenize(queries, show_progress=False)
+        indices, _scores = self.bm25.retrieve(
+            query_tokens, k=k, backend_selection=self.backend_selection, show_progress=False
+        )
+        return [[int(idx) for idx in row] for row in indices]
+
+    def save(self, directory: Path, fingerprint: str) -> None:
+        self.bm25.save(str(directory))
+        (directory / _BM25S_FINGERPRINT_NAME).write_text(fingerprint, encoding="utf-8")
+
+    @classmethod
+    def load(
+        cls, directory: Path, store: ChunkStore, k: int, fingerprint: str
+    ) -> BM25SRetriever | None:
+        # A stale index pairs row indices with the wrong corpus; only trust
+        # the mmap'd files when their fingerprint matches the current chunks.
+        try:
+            stored = (directory / _BM25S_FINGERPRINT_NAME).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        if stored != fingerprint:
+            return None
+        retriever = cls.__new__(cls)
+        retriever.k = k
+        retriever.n_docs = len(store)
+        retriever.bm25 = bm25s.BM25.load(str(directory), mmap=True)
+        retriever.backend_selection = "auto"
+        retriever._activate_numba()
+        return retriever
+
+
+class FaissDenseIndex:
+    """Exact inner-product index over the chunk embeddings held in RAM.
+
+    At this corpus scale a single BLAS matmul beats Chroma's HNSW round-trip;
+    embeddings stay L2-normalized so inner product equals cosine similarity.
+    """
+
+    def __init__(self, embeddings: np.ndarray, chunk_ids: list[str], k: int) -> None:
+        self.chunk_ids = chunk_ids
+        self.k = k
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        faiss.normalize_L2(embeddings)
+        dim = embeddings.shape[1]
+        if settings.rag.vector_precision == "int8":
+            # 4x smaller resident footprint; the scan is memory-bound at this
+            # scale, so narrower codes also mean faster scoring.
+            self.index = faiss.IndexScalarQuantizer(
+                dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.train(embeddings)
+        else:
+            self.index = faiss.IndexFlatIP(dim)
+        self.index.add(embeddings)
+
+    def search(self, query_vec: np.ndarray, k: int | None = None) -> list[tuple[str, float]]:
+        return self.search_batch(np.reshape(query_vec, (1, -1)), k)[0]
+
+    def search_batch(
+        self, query_matrix: np.ndarray, k: int | None = None
+    ) -> list[list[tuple[str, float]]]:
+        """Score a (B, d) batch of queries in one matmul against the index."""
+
+        k = min(k or self.k, self.index.ntotal)
+        queries = np.ascontiguousarray(query_matrix, dtype=np.float32)
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+        faiss.normalize_L2(queries)
+        scores, indices = self.index.search(queries, k)
+        return [
+            [
+                (self.chunk_ids[idx], float(score))
+                for idx, score in zip(row_indices, row_scores, strict=True)
+                if idx != -1
+            ]
+            for row_indices, row_scores in zip(indices, scores, strict=True)
+        ]
+
+
+def _build_dense_index() -> FaissDenseIndex | None:
+    """Pull the persisted embeddings out of Chroma once and index them flat."""
+
+    if faiss is None or settings.rag.dense_backend != "faiss":
+        return None
+    store = get_embedding_service().store
+    try:
+        data = store._collection.get(include=["embeddings"])  # noqa: SLF001
+    except Exception:  # noqa: BLE001
+        return None
+    ids = data.get("ids") or []
+    embeddings = data.get("embeddings")
+    if embeddings is None or len(embeddings) == 0 or not ids:
+        return None
+    return FaissDenseIndex(np.asarray(embeddings, dtype=np.float32), list(ids), settings.rag.top_k_dense)
+
+
+def _build_sparse(store: ChunkStore) -> Any:
+    """Build the sparse retriever: bm25s when installed, rank_bm25 otherwise."""
+
+    if not len(store):
+        return None
+    if bm25s is not None:
+        return BM25SRetriever(store, k=settings.rag.top_k_sparse)
+    return BM25Retriever.from_documents([store.document(row) for row in range(len(store))])
+
+
+def _load_sparse_cache(metadata_dir: Path, fingerprint: str, store: ChunkStore) -> Any:
+    if bm25s is not None:
+        bm25s_dir = metadata_dir / _BM25S_INDEX_DIRNAME
+        if bm25s_dir.exists():
+            return BM25SRetriever.load(
+                bm25s_dir, store, k=settings.rag.top_k_sparse, fingerprint=fingerprint
+            )
+        return None
+    cached = pickle.loads((metadata_dir / _BM25_CACHE_NAME).read_bytes())
+    if cached.get("fingerprint") != fingerprint:
+        return None
+    return cached["retriever"]
+
+
+def _save_sparse_cache(metadata_dir: Path, fingerprint: str, sparse: Any) -> None:
+    if isinstance(sparse, BM25SRetriever):
+        sparse.save(metadata_dir / _BM25S_INDEX_DIRNAME, fingerprint)
+    else:
+        (metadata_dir / _BM25_CACHE_NAME).write_bytes(
+            pickle.dumps({"fingerprint": fingerprint, "retriever": sparse})
+        )
+
+
+def _load_corpus() -> tuple[ChunkStore, Any]:
+    """Load the chunk store and sparse index, reusing on-disk caches when current.
+
+    Parsing the jsonl files and re-tokenizing BM25 from scratch is the
+    dominant cold-start cost, so both are memoized next to the metadata
+    keyed by a fingerprint of the source files.
+    """
+
+    chunk_files = _chunk_files()
+    if not chunk_files:
+        return ChunkStore(), None
+    metadata_dir = settings.paths.data_dir / "metadata"
+    fingerprint = _corpus_fingerprint(chunk_files)
+    chunks_cache = metadata_dir / _CHUNKS_CACHE_NAME
+    try:
+        cached_chunks = pickle.loads(chunks_cache.read_bytes())
+        if cached_chunks.get("fingerprint") == fingerprint:
+            store = cached_chunks["store"]
+            sparse = _load_sparse_cache(metadata_dir, fingerprint, store)
+            if sparse is not None or not len(store):
+                return store, sparse
+    except (OSError, pickle.PickleError, EOFError, AttributeError, KeyError):
+        pass
+
+    store = _load_chunk_store(chunk_files)
+    sparse = _build_sparse(store)
+    try:
+        chunks_cache.write_bytes(pickle.dumps({"fingerprint": fingerprint, "store": store}))
+        if sparse is not None:
+            _save_sparse_cache(metadata_dir, fingerprint, sparse)
+    except (OSError, pickle.PickleError):
+        pass
+    return store, sparse
+
+
+@lru_cache(maxsize=128)
+def _reorder_perm(n: int) -> np.ndarray:
+    """Lost-in-the-middle permutation for n ranked results.
+
+    Strongest results at both ends, weakest in the middle, as a memoized
+    index array applied with numpy fancy indexing instead of a Document-list
+    round-trip. Matches LongContextReorder exactly for odd n; for even n the
+    edges are mirrored (best result first rather than last), an equivalent
+    layout for the lost-in-the-middle effect.
+    """
+
+    return np.concatenate([np.arange(0, n, 2), np.arange(1, n, 2)[::-1]])
+
+
+class HybridRetriever:
+    """Combines dense (FAISS/Chroma) and sparse (BM25) retrievers with reranking."""
+
+    def __init__(self) -> None:
+        self.dense = get_embedding_service().store.as_retriever(
+            search_kwargs={"k": settings.rag.top_k_dense}
+        )
+        self.store, self.sparse = _load_corpus()
+        if self.sparse is not None:
+            self.sparse.k = settings.rag.top_k_sparse
+        self.dense_index = _build_dense_index()
+        # Per-instance LRU over normalized queries; hits skip the embedding
+        # call, BM25 scoring, and the merge entirely.
+        self._retrieve_cached = lru_cache(maxsize=_QUERY_CACHE_SIZE)(self._retrieve_uncached)
+
+    def retrieve(self, query: str) -> list[RetrievedChunk]:
+        normalized = " ".join(query.casefold().split())
+        return list(self._retrieve_cached(normalized))
+
+    async def aretrieve(self, query: str) -> list[RetrievedChunk]:
+        """Async retrieval running the dense and sparse stages concurrently.
+
+        Dense retrieval waits on the embedding call while BM25 burns CPU, so
+        overlapping them caps wall latency at max(dense, sparse) instead of
+        the sum. Skips the sync memo: first-seen queries are exactly the ones
+        that pay both stages.
+        """
+
+        normalized = " ".join(query.casefold().split())
+        dense_rows, sparse_rows = await asyncio.gather(
+            asyncio.to_thread(self._dense_rows, normalized),
+            asyncio.to_thread(self._sparse_rows, normalized),
+        )
+        return list(self._merge_rows(dense_rows, sparse_rows))
+
+    def retrieve_batch(self, queries: list[str]) -> list[list[RetrievedChunk]]:
+        """Retrieve for a batch of queries with one embedding and one BM25 call.
+
+        Evaluation sweeps score all queries in a single FAISS matmul and a
+        single (optionally numba-jitted) bm25s pass instead of N round-trips;
+        only the cheap per-query merge stays in Python.
+        """
+
+        if not queries:
+            return []
+        normalized = [" ".join(query.casefold().split()) for query in queries]
+        return [list(results) for results in self._retrieve_many(normalized)]
+
+    def _retrieve_many(self, normalized: list[str]) -> list[tuple[RetrievedChunk, ...]]:
+        dense_lists = self._dense_rows_batch(normalized)
+        sparse_lists = self._sparse_rows_batch(normalized)
+        return [
+            self._merge_rows(dense_rows, sparse_rows)
+            for dense_rows, sparse_rows in zip(dense_lists, sparse_lists, strict=True)
+        ]
+
+    def _dense_rows_batch(self, queries: list[str]) -> list[list[int]]:
+        if len(queries) == 1:
+            # Single queries stay on embed_query so they hit the in-process
+            # and sqlite embedding caches.
+            return [self._dense_rows(queries[0])]
+        if self.dense_index is None:
+            return [self._dense_rows(query) for query in queries]
+        vectors = np.asarray(
+            get_embedding_service().embedder.embed_documents(queries), dtype=np.float32
+        )
+        row_by_chunk_id = self.store.row_by_chunk_id
+        return [
+            [row_by_chunk_id[chunk_id] for chunk_id, _score in hits if chunk_id in row_by_chunk_id]
+            for hits in self.dense_index.search_batch(vectors)
+        ]
+
+    def _sparse_rows_batch(self, queries: list[str]) -> list[list[int]]:
+        if isinstance(self.sparse, BM25SRetriever):
+            return self.sparse.rows_batch(queries)
+        return [self._sparse_rows(query) for query in queries]
+
+    def _dense_rows(self, query: str) -> list[int]:
+        row_by_chunk_id = self.store.row_by_chunk_id
+        if self.dense_index is not None:
+            query_vec = np.asarray(get_embedding_service().embed_query(query), dtype=np.float32)
+            hits = self.dense_index.search(query_vec)
+            return [
+                row_by_chunk_id[chunk_id] for chunk_id, _score in hits if chunk_id in row_by_chunk_id
+            ]
+        if self.dense is None:
+            return []
+        rows: list[int] = []
+        for doc in self.dense.invoke(query):
+            row = row_by_chunk_id.get(doc.metadata.get("chunk_id"))
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def _sparse_rows(self, query: str) -> list[int]:
+        if self.sparse is None:
+            return []
+        if isinstance(self.sparse, BM25SRetriever):
+            return self.sparse.rows(query)
+        row_by_chunk_id = self.store.row_by_chunk_id
+        rows: list[int] = []
+        for doc in self.sparse.invoke(query):
+            row = row_by_chunk_id.get(doc.metadata.get("chunk_id"))
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def _retrieve_uncached(self, query: str) -> tuple[RetrievedChunk, ...]:
+        (results,) = self._retrieve_many([query])
+        return results
+
+    def _merge_rows(
+        self, dense_rows: list[int], sparse_rows: list[int]
+    ) -> tuple[RetrievedChunk, ...]:
+        if not dense_rows and not sparse_rows:
+            return ()
+        # Weighted rank scores for both stages in two vectorized expressions.
+        dense_scores = 0.7 * (1.0 - 0.05 * np.arange(len(dense_rows), dtype=np.float32))
+        sparse_scores = 0.3 * (1.0 - 0.05 * np.arange(len(sparse_rows), dtype=np.float32))
+        # Dedup + sort happen inside one compiled kernel (numpy fallback when
+        # numba is absent); each call gets its own score buffer, so no lock.
+        top_rows, _best = merge_topk(
+            np.asarray(dense_rows, dtype=np.int64),
+            dense_scores.astype(np.float32, copy=False),
+            np.asarray(sparse_rows, dtype=np.int64),
+            sparse_scores.astype(np.float32, copy=False),
+            len(self.store),
+            len(dense_rows) + len(sparse_rows),
+        )
+        materialize = self.store.materialize
+        return tuple(
+            RetrievedChunk(chunk=materialize(int(row)), score=1 - (rank * 0.05))
+            for rank, row in enumerate(top_rows[_reorder_perm(len(top_rows))])
+        )
+
+
+@lru_cache(maxsize=1)
+def get_hybrid_retriever() -> HybridRetriever:
+    """Build the shared retriever on first use instead of at import time.
+
+    The server warms this from its startup event, so request handlers and
+    tests share one instance.
+    """
+
+    return HybridRetriever()
+
+
+def reset_hybrid_retriever() -> None:
+    """Drop the shared retriever so the next call rebuilds against new chunks."""
+
+    get_hybrid_retriever.cache_clear()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from .retrieval import hybrid_retriever` keeps working without
+    # paying the corpus load on import.
+    if name == "hybrid_retriever":
+        return get_hybrid_retriever()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
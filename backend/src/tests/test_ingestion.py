@@ -1,9 +1,14 @@
 from pathlib import Path
 
+import pytest
+
+from src.app.config import settings
 from src.app.ingestion import IngestionPipeline
 
 
-def test_ingestion_chunking(tmp_path: Path):
+def test_ingestion_chunking(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Keep persisted metadata out of the tracked data/ directory.
+    monkeypatch.setattr(settings.paths, "data_dir", tmp_path / "data")
     sample = tmp_path / "sample.txt"
     sample.write_text("Line one.\nLine two.\nLine three.")
     pipeline = IngestionPipeline()
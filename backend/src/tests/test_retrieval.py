@@ -1,7 +1,18 @@
-from src.app.retrieval import HybridRetriever
+import pytest
 
+from src.app.retrieval import HybridRetriever, get_hybrid_retriever
 
-def test_hybrid_retriever_handles_empty_store():
-    retriever = HybridRetriever()
+
+@pytest.fixture(scope="session")
+def retriever() -> HybridRetriever:
+    return get_hybrid_retriever()
+
+
+def test_hybrid_retriever_handles_empty_store(retriever: HybridRetriever):
     results = retriever.retrieve("Test question")
     assert isinstance(results, list)
+
+
+async def test_aretrieve_matches_retrieve(retriever: HybridRetriever):
+    results = await retriever.aretrieve("Test question")
+    assert results == retriever.retrieve("Test question")
@@ -0,0 +1,25 @@
+import numpy as np
+
+from src.app.retrieval_kernels import _merge_topk_numpy, _merge_topk_scatter
+
+
+def test_scatter_and_numpy_kernels_agree():
+    rng = np.random.default_rng(42)
+    for _ in range(500):
+        n_chunks = int(rng.integers(1, 50))
+        n_dense = int(rng.integers(0, 20))
+        n_sparse = int(rng.integers(0, 20))
+        dense_rows = rng.integers(0, n_chunks, n_dense).astype(np.int64)
+        sparse_rows = rng.integers(0, n_chunks, n_sparse).astype(np.int64)
+        # Quantized scores force ties so the stable tie-break is covered too.
+        dense_scores = (rng.integers(0, 5, n_dense) / 4.0).astype(np.float32)
+        sparse_scores = (rng.integers(0, 5, n_sparse) / 4.0).astype(np.float32)
+        k = int(rng.integers(1, 25))
+        scatter_rows, scatter_scores = _merge_topk_scatter(
+            dense_rows, dense_scores, sparse_rows, sparse_scores, n_chunks, k
+        )
+        numpy_rows, numpy_scores = _merge_topk_numpy(
+            dense_rows, dense_scores, sparse_rows, sparse_scores, n_chunks, k
+        )
+        assert np.array_equal(scatter_rows, numpy_rows)
+        assert np.array_equal(scatter_scores, numpy_scores)